@@ -1,10 +1,15 @@
-from fastapi import FastAPI, HTTPException, BackgroundTasks, Request
-from fastapi.responses import HTMLResponse, StreamingResponse
-from fastapi.middleware.cors import CORSMiddleware
+from fastapi import FastAPI, HTTPException, BackgroundTasks, Depends, Request
+from fastapi.responses import FileResponse, HTMLResponse, ORJSONResponse, RedirectResponse, Response, StreamingResponse
 from pydantic import BaseModel, HttpUrl
 import asyncio
+import logging
+import logging.handlers
+import queue
 import subprocess
-import json
+import time
+import hashlib
+import gzip
+import mimetypes
 import uuid
 import os
 from datetime import datetime
@@ -12,39 +17,269 @@ from typing import Dict, List, Optional
 import re
 import tempfile
 import shutil
+from functools import lru_cache
 from pathlib import Path
+from urllib.parse import urlparse
 import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 import docker
 import aiofiles
+import aiohttp
+import orjson
 from dotenv import load_dotenv
 
+# google-cloud-storage is optional; the cloud endpoints report it as missing when absent
+try:
+    from google.api_core.exceptions import BadRequest as GCSBadRequest, NotFound as GCSNotFound
+    from google.cloud import storage
+    from google.cloud.storage import transfer_manager
+except ImportError:
+    storage = None
+
 # Load environment variables from .env file
 load_dotenv()
 
-app = FastAPI(title="Web Archive API - Local Docker")
+# Log records are written by a background thread so logging never blocks the event loop;
+# set DEBUG=1 to include per-container debug output
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.DEBUG if os.getenv("DEBUG") else logging.INFO)
+logger.propagate = False
+log_queue = queue.SimpleQueue()
+logger.addHandler(logging.handlers.QueueHandler(log_queue))
+log_stream_handler = logging.StreamHandler()
+log_stream_handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(message)s"))
+log_listener = logging.handlers.QueueListener(log_queue, log_stream_handler)
+log_listener.start()
+
+# API responses are encoded with orjson, which serializes straight to bytes in C
+app = FastAPI(title="Web Archive API - Local Docker", default_response_class=ORJSONResponse)
+
+# Shared by every GCS proxy request so range requests reuse pooled keep-alive
+# connections instead of opening a new TLS connection each time
+gcs_http: Optional[aiohttp.ClientSession] = None
 
 @app.on_event("startup")
 async def startup_event():
     """Handle async startup tasks"""
+    global gcs_http
+    gcs_http = aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(limit=GCS_PROXY_CONNECTIONS, keepalive_timeout=75)
+    )
     try:
         await cleanup_orphaned_jobs()
     except Exception:
         pass  # Don't let cleanup failures prevent startup
 
-# Add CORS middleware for replayweb.page integration
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"],
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Write out any buffered progress updates and log records before exiting"""
+    try:
+        await job_manager.flush()
+        # Unset if startup failed before creating it, or ran without lifespan events
+        if gcs_http is not None:
+            await gcs_http.close()
+    finally:
+        log_listener.stop()
+
+# The CORS policy allows every origin, method and header, so the response headers
+# are fixed and only the preflight's requested headers (and the origin, for
+# preflights and cookie requests) need echoing
+CORS_HEADERS = [
+    (b"access-control-allow-origin", b"*"),
+    (b"access-control-allow-credentials", b"true"),
+]
+CORS_HEADER_NAMES = frozenset(name for name, _ in CORS_HEADERS)
+CORS_PREFLIGHT_HEADERS = [
+    (b"access-control-allow-credentials", b"true"),
+    (b"access-control-allow-methods", b"DELETE, GET, HEAD, OPTIONS, PATCH, POST, PUT"),
+    (b"access-control-max-age", b"600"),
+    (b"vary", b"Origin"),
+    (b"content-type", b"text/plain; charset=utf-8"),
+    (b"content-length", b"2"),
+]
+
+class StaticCORSMiddleware:
+    """Same policy as CORSMiddleware(allow_origins/methods/headers=["*"], allow_credentials=True)
+    without its per-request option matching"""
+    
+    def __init__(self, app):
+        self.app = app
+    
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        origin = request_method = request_headers = None
+        has_cookie = False
+        for name, value in scope["headers"]:
+            if name == b"origin":
+                origin = value
+            elif name == b"access-control-request-method":
+                request_method = value
+            elif name == b"access-control-request-headers":
+                request_headers = value
+            elif name == b"cookie":
+                has_cookie = True
+        
+        if origin is None:
+            await self.app(scope, receive, send)
+            return
+        
+        # Preflights may precede a credentialed request, which browsers reject with
+        # "*", so like CORSMiddleware they always get the origin echoed back
+        if scope["method"] == "OPTIONS" and request_method is not None:
+            headers = [(b"access-control-allow-origin", origin)] + CORS_PREFLIGHT_HEADERS
+            if request_headers is not None:
+                headers.append((b"access-control-allow-headers", request_headers))
+            await send({"type": "http.response.start", "status": 200, "headers": headers})
+            await send({"type": "http.response.body", "body": b"OK"})
+            return
+        
+        async def send_with_cors(message):
+            if message["type"] == "http.response.start":
+                # Replace rather than append so routes that set their own CORS headers
+                # never end up with duplicate Access-Control-Allow-Origin values
+                headers = [
+                    (name, value) for name, value in message.get("headers", [])
+                    if name not in CORS_HEADER_NAMES
+                ]
+                if has_cookie:
+                    # Cookie requests are credentialed, so echo the origin, and vary
+                    # on it alongside whatever the route already varies on
+                    headers += [(b"access-control-allow-origin", origin), CORS_HEADERS[1]]
+                    vary = [value for name, value in headers if name == b"vary"]
+                    headers = [(name, value) for name, value in headers if name != b"vary"]
+                    headers.append((b"vary", b", ".join(vary + [b"Origin"])))
+                else:
+                    headers += CORS_HEADERS
+                message["headers"] = headers
+            await send(message)
+        
+        await self.app(scope, receive, send_with_cors)
+
+# CORS for replayweb.page integration
+app.add_middleware(StaticCORSMiddleware)
 
 # Local configuration
 ARCHIVE_DIR = os.getenv("ARCHIVE_DIR", "./archives")
 DB_PATH = os.getenv("DB_PATH", "./data/archives.db")
 PORT = int(os.getenv("PORT", 8080))
 
+# Long-lived SQLite connections: one writer plus a pool of readers, which WAL mode
+# lets run alongside the writer
+SQLITE_READ_CONNECTIONS = 4
+# Prepared statements kept per connection; update statements vary by column set
+SQLITE_CACHED_STATEMENTS = 256
+# Applied to every connection: pages are read through a 256 MiB memory map and
+# a 64 MiB page cache rather than one pread per page, and a connection that finds
+# the database locked (e.g. by another worker process) retries for up to 5 seconds
+SQLITE_PRAGMAS = (
+    "PRAGMA busy_timeout=5000",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-65536",
+    "PRAGMA mmap_size=268435456",
+)
+# Applied to the writer only; readers are opened read-only
+SQLITE_WRITER_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA wal_autocheckpoint=1000",
+)
+
+# Archives larger than one chunk are uploaded to GCS as parallel multipart chunks
+GCS_UPLOAD_CHUNK_SIZE = 32 * 1024 * 1024
+GCS_UPLOAD_WORKERS = 8
+# WACZ files are already zip-compressed, so they are uploaded as-is but marked cacheable
+# for replayweb.page, which re-reads byte ranges of the same archive many times
+GCS_CACHE_CONTROL = "public, max-age=3600"
+
+# Job fields that only report crawl progress; updates touching nothing else are
+# buffered per job and written together once per flush interval
+PROGRESS_FIELDS = frozenset({"progress", "pages_archived", "current_depth"})
+PROGRESS_FLUSH_INTERVAL = 1.0
+
+# Idle progress streams send a comment line this often (seconds)
+SSE_HEARTBEAT_INTERVAL = 30
+# Job changes buffered per progress stream; a client that falls further behind
+# than this is sent a fresh snapshot instead
+SSE_SUBSCRIBER_QUEUE_SIZE = 1000
+
+# Statuses of jobs with work in flight, which a restart leaves orphaned. The SQL
+# form is spelled out as literals so SQLite can match queries to the partial index
+# on these statuses, which it cannot do for bound parameters
+ACTIVE_JOB_STATUSES = ("started", "crawling", "preparing", "uploading_gcs")
+ACTIVE_JOB_STATUSES_SQL = ", ".join(f"'{status}'" for status in ACTIVE_JOB_STATUSES)
+
+# Job columns the frontend renders; the progress stream selects only these
+JOB_SUMMARY_COLUMNS = (
+    "job_id", "url", "status", "progress", "created_at", "completed_at",
+    "local_path", "gcs_url", "gcs_error", "crawler_type", "crawler_reason",
+    "pages_archived", "current_depth", "file_size"
+)
+
+# Headers for archive responses so replayweb.page can fetch byte ranges cross-origin;
+# handlers copy these and add Content-Type / Content-Length per request
+ARCHIVE_RESPONSE_HEADERS = {
+    "Accept-Ranges": "bytes",
+    "Access-Control-Allow-Origin": "*",
+    "Access-Control-Allow-Methods": "GET, HEAD, OPTIONS",
+    "Access-Control-Allow-Headers": "*",
+    "Access-Control-Expose-Headers": "Accept-Ranges, Content-Length, Content-Range",
+    "Cross-Origin-Embedder-Policy": "require-corp",
+    "Cross-Origin-Opener-Policy": "same-origin"
+}
+
+# Concurrent upstream connections the GCS proxy keeps open
+GCS_PROXY_CONNECTIONS = 100
+
+# Read size when streaming archive byte ranges, local or proxied from GCS
+ARCHIVE_STREAM_CHUNK_SIZE = 1024 * 1024
+
+# Single "bytes=<start>-<end>" range; either bound may be empty
+RANGE_RE = re.compile(r'\s*bytes\s*=\s*(\d*)\s*-\s*(\d*)\s*')
+# Longest answer to an open-ended "bytes=<start>-" request; such clients continue from
+# the returned Content-Range. Closed and suffix ranges are always served in full,
+# since replayweb.page asks for exact record ranges and does not re-request the rest
+ARCHIVE_MAX_RANGE_SIZE = 8 * 1024 * 1024
+
+# Answer to CORS preflight requests on the archive endpoints
+ARCHIVE_PREFLIGHT_HEADERS = {
+    "Access-Control-Allow-Origin": "*",
+    "Access-Control-Allow-Methods": "GET, HEAD, OPTIONS",
+    "Access-Control-Allow-Headers": "*",
+    "Access-Control-Max-Age": "86400"
+}
+
+# Matches any browsertrix log message that can signal page progress, so lines
+# without one can be skipped before paying for a JSON parse
+PAGE_EVENT_RE = re.compile(rb'Page Finished|moving on to next page|Starting page')
+# "<current>/<total> pages" counter in crawler output
+PAGE_COUNT_RE = re.compile(r'(\d+)/(\d+) pages')
+
+# browsertrix-crawler arguments shared by every crawl; only the URL and collection
+# name vary per job, so the rest of the command line is built once here
+BROWSERTRIX_CRAWL_ARGS = (
+    "--depth", "6",  # Increased depth for deeper crawling
+    "--limit", "200",  # Increased page limit
+    "--timeout", "1800",  # Increased timeout to 30 minutes
+    "--workers", "3",  # More workers for faster crawling
+    "--screenshot", "view",
+    "--screencastTimeout", "15",
+    "--behaviors", "autoscroll,autoplay,autofetch,siteSpecific",
+    "--userAgent", "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+    "--scopeType", "host",  # Changed from "prefix" to "host" for broader crawling
+    "--include", "same-domain",
+    "--extraHops", "1",  # Allow one extra hop to find more content
+    "--delay", "0",  # No delay for faster crawling
+    "--maxLoadWaitTime", "10000",  # Wait up to 10 seconds for page loads
+    "--generateWACZ",
+    "--text",
+    "--logging", "info",
+)
+
 def cleanup_orphaned_containers():
     """Clean up any browsertrix containers that may be running from previous sessions"""
     if not docker_client:
@@ -71,20 +306,16 @@ def cleanup_orphaned_containers():
 async def cleanup_orphaned_jobs():
     """Update job status for jobs that were running when the app restarted"""
     try:
-        # Initialize a temporary job manager to update orphaned jobs
-        temp_job_manager = SQLiteJobManager(DB_PATH)
-        
         # Find all jobs that were in active states
-        all_jobs = await temp_job_manager.get_all_jobs()
-        active_statuses = ["started", "crawling", "preparing", "uploading_gcs"]
+        active_jobs = await job_manager.get_active_jobs()
+        stopped_at = datetime.now().isoformat()
         
-        for job in all_jobs:
-            if job.get("status") in active_statuses:
-                # Mark as stopped since containers were cleaned up
-                await temp_job_manager.update_job(job["job_id"], {
-                    "status": "stopped",
-                    "completed_at": datetime.now().isoformat()
-                })
+        for job in active_jobs:
+            # Mark as stopped since containers were cleaned up
+            await job_manager.update_job(job["job_id"], {
+                "status": "stopped",
+                "completed_at": stopped_at
+            })
                 
     except Exception as e:
         pass
@@ -109,10 +340,27 @@ except Exception as e:
 # Ensure archive directory exists
 os.makedirs(ARCHIVE_DIR, exist_ok=True)
 
+# Columns added to archive_jobs after its first release, in the order they were added
+ADDED_JOB_COLUMNS = {
+    "gcs_url": "TEXT",
+    "gcs_error": "TEXT",
+    "pages_archived": "INTEGER DEFAULT 0",
+    "current_depth": "INTEGER DEFAULT 1",
+    "container_id": "TEXT",
+    "file_size": "INTEGER DEFAULT 0",
+    "gcs_bucket": "TEXT",
+    "gcs_object": "TEXT",
+}
+
 # Initialize SQLite database
 def init_db():
     conn = sqlite3.connect(DB_PATH)
     cursor = conn.cursor()
+    # Switch to WAL before creating anything; the mode is stored in the database file
+    cursor.execute('PRAGMA journal_mode=WAL')
+    # Schema creation, migrations and indexes commit together, so a failed startup
+    # can't leave a half-migrated table behind
+    cursor.execute('BEGIN')
     cursor.execute('''
         CREATE TABLE IF NOT EXISTS archive_jobs (
             job_id TEXT PRIMARY KEY,
@@ -132,47 +380,25 @@ def init_db():
         )
     ''')
     
-    # Add gcs_url column if it doesn't exist (for existing databases)
-    try:
-        cursor.execute('ALTER TABLE archive_jobs ADD COLUMN gcs_url TEXT')
-    except sqlite3.OperationalError:
-        # Column already exists
-        pass
-    
-    # Add gcs_error column if it doesn't exist (for existing databases)
-    try:
-        cursor.execute('ALTER TABLE archive_jobs ADD COLUMN gcs_error TEXT')
-    except sqlite3.OperationalError:
-        # Column already exists
-        pass
-    
-    # Add pages_archived column if it doesn't exist (for existing databases)
-    try:
-        cursor.execute('ALTER TABLE archive_jobs ADD COLUMN pages_archived INTEGER DEFAULT 0')
-    except sqlite3.OperationalError:
-        # Column already exists
-        pass
-    
-    # Add current_depth column if it doesn't exist (for existing databases)
-    try:
-        cursor.execute('ALTER TABLE archive_jobs ADD COLUMN current_depth INTEGER DEFAULT 1')
-    except sqlite3.OperationalError:
-        # Column already exists
-        pass
-    
-    # Add container_id column if it doesn't exist (for existing databases)
-    try:
-        cursor.execute('ALTER TABLE archive_jobs ADD COLUMN container_id TEXT')
-    except sqlite3.OperationalError:
-        # Column already exists
-        pass
-    
-    # Add file_size column if it doesn't exist (for existing databases)
-    try:
-        cursor.execute('ALTER TABLE archive_jobs ADD COLUMN file_size INTEGER DEFAULT 0')
-    except sqlite3.OperationalError:
-        # Column already exists
-        pass
+    # Add columns introduced after the original schema (for existing databases)
+    cursor.execute('PRAGMA table_info(archive_jobs)')
+    existing_columns = {row[1] for row in cursor.fetchall()}
+    for column, definition in ADDED_JOB_COLUMNS.items():
+        if column not in existing_columns:
+            cursor.execute(f'ALTER TABLE archive_jobs ADD COLUMN {column} {definition}')
+    
+    # Job lists are always newest first, and the archives list filters on status too;
+    # these let SQLite walk an index instead of scanning and sorting the table
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_jobs_status_created ON archive_jobs(status, created_at DESC)')
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_jobs_created ON archive_jobs(created_at DESC)')
+    # A status value spans about a third of the table, so the planner would rather walk
+    # idx_jobs_created than look up several statuses at once; this one covers only
+    # active jobs, which are few
+    cursor.execute(
+        'CREATE INDEX IF NOT EXISTS idx_jobs_active ON archive_jobs(created_at DESC) '
+        f'WHERE status IN ({ACTIVE_JOB_STATUSES_SQL})'
+    )
+    cursor.execute('ANALYZE')
     
     conn.commit()
     conn.close()
@@ -195,74 +421,222 @@ class JobStatus(BaseModel):
 class SQLiteJobManager:
     def __init__(self, db_path: str):
         self.db_path = db_path
+        # Connections stay open for the life of the process so each query reuses a
+        # warm page cache instead of reopening the database file
+        self._writer = self._connect(read_only=False)
+        self._writer_lock = threading.Lock()
+        self._readers: queue.Queue = queue.Queue()
+        for _ in range(SQLITE_READ_CONNECTIONS):
+            self._readers.put(self._connect(read_only=True))
+        # Database work gets its own threads, one per connection, so slow file or GCS
+        # jobs in the default executor never queue ahead of a job lookup
+        self._executor = ThreadPoolExecutor(
+            max_workers=SQLITE_READ_CONNECTIONS + 1, thread_name_prefix="sqlite"
+        )
+        # Bumped on every write so cached snapshots can tell when the job list has changed
+        self.version = 0
+        # Progress-only updates waiting to be flushed, merged per job
+        self._pending_progress: Dict[str, dict] = {}
+        self._flush_task: Optional[asyncio.Task] = None
+        # Serializes writes so a flush can never land after a newer status update
+        self._write_lock = asyncio.Lock()
+        # One queue per open progress stream; each committed change is pushed to all of them
+        self._subscribers: set = set()
+    
+    def subscribe(self) -> asyncio.Queue:
+        """Queue receiving (event name, data) pairs, or None when the subscriber fell
+        behind and needs a full snapshot"""
+        subscriber = asyncio.Queue(maxsize=SSE_SUBSCRIBER_QUEUE_SIZE)
+        self._subscribers.add(subscriber)
+        return subscriber
+    
+    def unsubscribe(self, subscriber: asyncio.Queue):
+        self._subscribers.discard(subscriber)
+    
+    def _mark_changed(self, events: List[tuple]):
+        self.version += 1
+        for subscriber in self._subscribers:
+            for event in events:
+                try:
+                    subscriber.put_nowait(event)
+                except asyncio.QueueFull:
+                    # Deltas are useless once some are lost, so ask for a resync instead
+                    while not subscriber.empty():
+                        subscriber.get_nowait()
+                    subscriber.put_nowait(None)
+                    break
+    
+    @staticmethod
+    def _delta_event(job_id: str, updates: dict) -> List[tuple]:
+        # Subscribers render job summaries, so internal fields like container_id are left out
+        delta = {key: value for key, value in updates.items() if key in JOB_SUMMARY_COLUMNS}
+        return [("job.update", {**delta, "job_id": job_id})] if delta else []
+    
+    def _connect(self, read_only: bool) -> sqlite3.Connection:
+        # The writer is opened first and switches the database to WAL, after which
+        # read-only connections never block on (or get blocked by) the writer
+        uri = Path(self.db_path).absolute().as_uri()
+        if read_only:
+            uri += "?mode=ro"
+        # Shared across executor threads; the pool ensures one thread per connection at a time
+        conn = sqlite3.connect(
+            uri, uri=True, check_same_thread=False, cached_statements=SQLITE_CACHED_STATEMENTS
+        )
+        # Rows convert straight to dicts in C instead of zipping with cursor.description
+        conn.row_factory = sqlite3.Row
+        for pragma in SQLITE_PRAGMAS if read_only else SQLITE_PRAGMAS + SQLITE_WRITER_PRAGMAS:
+            conn.execute(pragma)
+        return conn
+    
+    @contextmanager
+    def _conn(self, write: bool = False):
+        """Borrow the writer or a reader connection for the duration of the block"""
+        if write:
+            with self._writer_lock:
+                yield self._writer
+            return
+        
+        conn = self._readers.get()
+        try:
+            yield conn
+        finally:
+            self._readers.put(conn)
+    
+    # sqlite3 calls block, so every public method runs its query in a worker
+    # thread to keep the event loop free for SSE clients and other requests
+    
+    async def _run(self, func, *args):
+        return await asyncio.get_running_loop().run_in_executor(self._executor, func, *args)
+    
+    def _create_job(self, job_data: dict):
+        with self._conn(write=True) as conn:
+            conn.execute('''
+                INSERT INTO archive_jobs 
+                (job_id, url, status, progress, created_at, completed_at, archive_path, local_path, crawler_type, crawler_reason, complexity_score)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ''', (
+                job_data['job_id'], job_data['url'], job_data['status'], job_data['progress'],
+                job_data['created_at'], job_data.get('completed_at'), job_data.get('archive_path'),
+                job_data.get('local_path'), job_data.get('crawler_type'), job_data.get('crawler_reason'),
+                job_data.get('complexity_score', 0)
+            ))
+            conn.commit()
+    
+    def _update_jobs(self, updates_by_job: Dict[str, dict]):
+        # Jobs updating the same columns share one statement, so each group is a single
+        # executemany; sorting makes the grouping independent of dict order
+        rows_by_columns: Dict[tuple, list] = {}
+        for job_id, updates in updates_by_job.items():
+            columns = tuple(sorted(updates))
+            rows_by_columns.setdefault(columns, []).append([updates[key] for key in columns] + [job_id])
+        
+        with self._conn(write=True) as conn:
+            for columns, rows in rows_by_columns.items():
+                set_clause = ', '.join([f'{key} = ?' for key in columns])
+                conn.executemany(f'UPDATE archive_jobs SET {set_clause} WHERE job_id = ?', rows)
+            
+            # One commit for the whole batch
+            conn.commit()
+    
+    def _get_job(self, job_id: str) -> Optional[dict]:
+        with self._conn() as conn:
+            row = conn.execute('SELECT * FROM archive_jobs WHERE job_id = ?', (job_id,)).fetchone()
+        
+        return dict(row) if row else None
+    
+    def _get_jobs(self, query: str, params: tuple = ()) -> List[dict]:
+        with self._conn() as conn:
+            rows = conn.execute(query, params).fetchall()
+        
+        return [dict(row) for row in rows]
+    
+    def _delete_job(self, job_id: str):
+        with self._conn(write=True) as conn:
+            conn.execute('DELETE FROM archive_jobs WHERE job_id = ?', (job_id,))
+            conn.commit()
     
     async def create_job(self, job_data: dict) -> str:
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        cursor.execute('''
-            INSERT INTO archive_jobs 
-            (job_id, url, status, progress, created_at, completed_at, archive_path, local_path, crawler_type, crawler_reason, complexity_score)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        ''', (
-            job_data['job_id'], job_data['url'], job_data['status'], job_data['progress'],
-            job_data['created_at'], job_data.get('completed_at'), job_data.get('archive_path'),
-            job_data.get('local_path'), job_data.get('crawler_type'), job_data.get('crawler_reason'),
-            job_data.get('complexity_score', 0)
-        ))
-        conn.commit()
-        conn.close()
+        await self._run(self._create_job, job_data)
+        self._mark_changed(self._delta_event(job_data['job_id'], job_data))
         return job_data['job_id']
     
     async def update_job(self, job_id: str, updates: dict):
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        if updates.keys() <= PROGRESS_FIELDS:
+            # Progress ticks are superseded quickly, so only the latest values get written
+            self._pending_progress.setdefault(job_id, {}).update(updates)
+            if self._flush_task is None or self._flush_task.done():
+                self._flush_task = asyncio.create_task(self._flush_later())
+            return
         
-        set_clause = ', '.join([f'{key} = ?' for key in updates.keys()])
-        values = list(updates.values()) + [job_id]
-        
-        cursor.execute(f'UPDATE archive_jobs SET {set_clause} WHERE job_id = ?', values)
-        conn.commit()
-        conn.close()
+        async with self._write_lock:
+            # Fold buffered progress into this write so it cannot be applied afterwards
+            pending = self._pending_progress.pop(job_id, None)
+            if pending:
+                updates = {**pending, **updates}
+            await self._run(self._update_jobs, {job_id: updates})
+        self._mark_changed(self._delta_event(job_id, updates))
+    
+    async def _flush_later(self):
+        await asyncio.sleep(PROGRESS_FLUSH_INTERVAL)
+        try:
+            await self.flush()
+        except Exception:
+            # flush() has put the updates back in the buffer; try again next interval
+            logger.exception("Failed to write buffered progress updates, retrying")
+            self._flush_task = asyncio.create_task(self._flush_later())
+    
+    async def flush(self):
+        """Write all buffered progress updates in a single transaction"""
+        async with self._write_lock:
+            if not self._pending_progress:
+                return
+            pending, self._pending_progress = self._pending_progress, {}
+            try:
+                await self._run(self._update_jobs, pending)
+            except Exception:
+                # Keep the updates for the next flush; anything buffered meanwhile is newer
+                for job_id, updates in pending.items():
+                    self._pending_progress[job_id] = {**updates, **self._pending_progress.get(job_id, {})}
+                raise
+        self._mark_changed([
+            event for job_id, updates in pending.items() for event in self._delta_event(job_id, updates)
+        ])
     
     async def get_job(self, job_id: str) -> Optional[dict]:
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        cursor.execute('SELECT * FROM archive_jobs WHERE job_id = ?', (job_id,))
-        row = cursor.fetchone()
-        
-        if row:
-            columns = [desc[0] for desc in cursor.description]
-            conn.close()
-            return dict(zip(columns, row))
-        conn.close()
-        return None
+        return await self._run(self._get_job, job_id)
     
     async def get_all_jobs(self) -> List[dict]:
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        cursor.execute('SELECT * FROM archive_jobs ORDER BY created_at DESC')
-        rows = cursor.fetchall()
-        columns = [desc[0] for desc in cursor.description]
-        conn.close()
-        
-        return [dict(zip(columns, row)) for row in rows]
+        return await self._run(
+            self._get_jobs, 'SELECT * FROM archive_jobs ORDER BY created_at DESC'
+        )
+    
+    async def get_job_summaries(self) -> List[dict]:
+        """All jobs, newest first, with only the columns the UI renders"""
+        return await self._run(
+            self._get_jobs,
+            f'SELECT {", ".join(JOB_SUMMARY_COLUMNS)} FROM archive_jobs ORDER BY created_at DESC'
+        )
     
     async def get_completed_jobs(self) -> List[dict]:
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        cursor.execute('SELECT * FROM archive_jobs WHERE status = ? ORDER BY created_at DESC', ('completed',))
-        rows = cursor.fetchall()
-        columns = [desc[0] for desc in cursor.description]
-        conn.close()
-        
-        return [dict(zip(columns, row)) for row in rows]
+        return await self._run(
+            self._get_jobs,
+            'SELECT * FROM archive_jobs WHERE status = ? ORDER BY created_at DESC',
+            ('completed',)
+        )
+    
+    async def get_active_jobs(self) -> List[dict]:
+        """Jobs in an active status, newest first, read from the partial index on them"""
+        return await self._run(
+            self._get_jobs,
+            f'SELECT * FROM archive_jobs WHERE status IN ({ACTIVE_JOB_STATUSES_SQL}) '
+            'ORDER BY created_at DESC'
+        )
     
     async def delete_job(self, job_id: str):
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        cursor.execute('DELETE FROM archive_jobs WHERE job_id = ?', (job_id,))
-        conn.commit()
-        conn.close()
+        async with self._write_lock:
+            self._pending_progress.pop(job_id, None)
+            await self._run(self._delete_job, job_id)
+        self._mark_changed([("job.delete", {"job_id": job_id})])
 
 # Initialize job manager
 job_manager = SQLiteJobManager(DB_PATH)
@@ -270,43 +644,98 @@ job_manager = SQLiteJobManager(DB_PATH)
 class LocalStorageManager:
     def __init__(self, archive_dir: str):
         self.archive_dir = archive_dir
-        os.makedirs(archive_dir, exist_ok=True)
+        # Directories created by this process, so repeat saves skip the mkdir syscall
+        self._known_dirs = set()
+        self.ensure_dir(archive_dir)
+    
+    def ensure_dir(self, path: str):
+        if path in self._known_dirs:
+            return
+        os.makedirs(path, exist_ok=True)
+        self._known_dirs.add(path)
+    
+    def forget_dir(self, path: str):
+        """Call after removing a directory so the next save recreates it"""
+        self._known_dirs.discard(path)
     
     async def save_archive(self, content: str, job_id: str, filename: str) -> str:
         """Save archive to local storage and return path"""
         job_dir = os.path.join(self.archive_dir, job_id)
-        os.makedirs(job_dir, exist_ok=True)
+        self.ensure_dir(job_dir)
         
         file_path = os.path.join(job_dir, filename)
-        async with aiofiles.open(file_path, 'w', encoding='utf-8') as f:
-            await f.write(content)
+        # Encode up front so the whole archive goes out in a single write on a worker thread,
+        # instead of a thread hop per chunk through aiofiles' 8 KiB text buffer
+        await asyncio.to_thread(Path(file_path).write_bytes, content.encode('utf-8'))
         
         return file_path
     
+    def _copy_file(self, src: str, dst: str):
+        """Copy inside the kernel, letting copy-on-write filesystems clone instead of copy"""
+        try:
+            with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+                remaining = os.fstat(fsrc.fileno()).st_size
+                if hasattr(os, 'posix_fadvise'):
+                    os.posix_fadvise(fsrc.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+                while remaining > 0:
+                    copied = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                    if copied == 0:
+                        break
+                    remaining -= copied
+                # The source is a crawl temp file that is deleted next, so its cached pages
+                # are of no further use
+                if hasattr(os, 'posix_fadvise'):
+                    os.posix_fadvise(fsrc.fileno(), 0, 0, os.POSIX_FADV_DONTNEED)
+        except (AttributeError, OSError):
+            # No copy_file_range here (non-Linux, old kernel, cross-filesystem);
+            # shutil falls back to sendfile or a buffered copy
+            shutil.copyfile(src, dst)
+        shutil.copystat(src, dst)
+    
     async def save_binary_archive(self, file_path: str, job_id: str, filename: str) -> str:
         """Copy binary archive to local storage"""
         job_dir = os.path.join(self.archive_dir, job_id)
-        os.makedirs(job_dir, exist_ok=True)
+        self.ensure_dir(job_dir)
         
         dest_path = os.path.join(job_dir, filename)
-        shutil.copy2(file_path, dest_path)
+        # WACZ files can be hundreds of MB, so copy in a worker thread. A retried job
+        # rewrites the same filename while it may be being served, so the copy goes to
+        # a temporary name and is renamed into place only once complete
+        partial_path = dest_path + ".part"
+        try:
+            await asyncio.to_thread(self._copy_file, file_path, partial_path)
+            await asyncio.to_thread(os.replace, partial_path, dest_path)
+        except BaseException:
+            # Don't leave a half-written copy behind (cancellation included)
+            try:
+                os.remove(partial_path)
+            except OSError:
+                pass
+            raise
         
         return dest_path
     
+    @staticmethod
+    def _list_archives(job_dir: str) -> List[str]:
+        # scandir entries carry their type, so no per-file stat is needed; copies still
+        # in progress are left out
+        try:
+            with os.scandir(job_dir) as entries:
+                return [e.name for e in entries if e.is_file() and not e.name.endswith(".part")]
+        except FileNotFoundError:
+            return []
+    
     async def list_archives(self, job_id: str) -> List[str]:
         """List all archives for a job"""
         job_dir = os.path.join(self.archive_dir, job_id)
-        if not os.path.exists(job_dir):
-            return []
-        
-        return [f for f in os.listdir(job_dir) if os.path.isfile(os.path.join(job_dir, f))]
+        # Directory scans hit the filesystem, so keep them off the event loop
+        return await asyncio.to_thread(self._list_archives, job_dir)
 
 # Initialize storage manager
 storage_manager = LocalStorageManager(ARCHIVE_DIR)
 
-@app.get("/", response_class=HTMLResponse)
-async def get_frontend():
-    return """
+# The frontend never changes at runtime, so encode it and hash it once at import
+FRONTEND_HTML = """
     <!DOCTYPE html>
     <html>
     <head>
@@ -443,8 +872,7 @@ async def get_frontend():
                     showMessage(`📋 Archive job created! Check "Active Jobs" below for progress. Job ID: ${result.job_id}`, 'success');
                     document.getElementById('urlInput').value = '';
                     
-                    // Immediately load and display the new job
-                    await loadExistingArchives();
+                    // Reconnecting sends a fresh snapshot, which already includes the new job
                     startProgressMonitoring();
                 } catch (error) {
                     showMessage(`Error: ${error.message}`, 'error');
@@ -461,12 +889,19 @@ async def get_frontend():
                 }
 
                 eventSource = new EventSource('/api/progress');
-                eventSource.onmessage = function(event) {
-                    const data = JSON.parse(event.data);
-                    if (data.jobs && Array.isArray(data.jobs)) {
-                        updateJobList(data.jobs);
-                    }
-                };
+                // Full job list, sent on connect and whenever the stream has to resync
+                eventSource.addEventListener('snapshot', function(event) {
+                    updateJobList(JSON.parse(event.data).jobs);
+                });
+                // Only the fields that changed, plus job_id
+                eventSource.addEventListener('job.update', function(event) {
+                    const delta = JSON.parse(event.data);
+                    applyJobDelta(delta.job_id, delta);
+                });
+                eventSource.addEventListener('job.delete', function(event) {
+                    delete jobs[JSON.parse(event.data).job_id];
+                    renderJobs();
+                });
 
                 eventSource.onerror = function() {
                     setTimeout(startProgressMonitoring, 5000);
@@ -481,7 +916,19 @@ async def get_frontend():
                         jobs[job.job_id] = job;
                     }
                 });
-                
+                renderJobs();
+            }
+
+            function applyJobDelta(jobId, delta) {
+                // Merge changed fields into the job; new jobs arrive with all their fields
+                const job = Object.assign({}, jobs[jobId], delta);
+                if (job.url && job.status) {
+                    jobs[jobId] = job;
+                    renderJobs();
+                }
+            }
+
+            function renderJobs() {
                 const allJobsDiv = document.getElementById('allJobs');
                 allJobsDiv.innerHTML = '';
                 
@@ -797,30 +1244,43 @@ async def get_frontend():
             }
 
             window.onload = function() {
+                // The progress stream opens with a snapshot of every job, so the list is
+                // rendered from it; a separate fetch could land after newer deltas
                 startProgressMonitoring();
-                loadExistingArchives();
             };
-
-            async function loadExistingArchives() {
-                try {
-                    const response = await fetch('/api/jobs');
-                    if (response.ok) {
-                        const jobs = await response.json();
-                        updateJobList(jobs);
-                    }
-                } catch (error) {
-                    // Failed to load existing jobs
-                }
-            }
         </script>
     </body>
     </html>
-    """
+"""
+FRONTEND_BYTES = FRONTEND_HTML.encode("utf-8")
+FRONTEND_GZIP_BYTES = gzip.compress(FRONTEND_BYTES, 9)
+FRONTEND_ETAG = f'"{hashlib.md5(FRONTEND_BYTES).hexdigest()}"'
+# Browsers revalidate on every load and get a 304 until a new deploy changes the page;
+# the gzip variant has its own ETag since it is a different byte representation
+FRONTEND_HEADERS = {"ETag": FRONTEND_ETAG, "Cache-Control": "no-cache", "Vary": "Accept-Encoding"}
+FRONTEND_GZIP_HEADERS = {
+    **FRONTEND_HEADERS,
+    "ETag": FRONTEND_ETAG[:-1] + '-gzip"',
+    "Content-Encoding": "gzip"
+}
 
+@app.get("/", response_class=HTMLResponse)
+async def get_frontend(request: Request):
+    if "gzip" in request.headers.get("accept-encoding", ""):
+        content, headers = FRONTEND_GZIP_BYTES, FRONTEND_GZIP_HEADERS
+    else:
+        content, headers = FRONTEND_BYTES, FRONTEND_HEADERS
+    
+    if request.headers.get("if-none-match") == headers["ETag"]:
+        return Response(status_code=304, headers=headers)
+    return Response(content=content, media_type="text/html", headers=headers)
+
+@lru_cache(maxsize=4096)
 def analyze_url_for_crawler_type(url: str) -> dict:
-    """Always use browsertrix-crawler for professional web archiving"""
-    from urllib.parse import urlparse
+    """Always use browsertrix-crawler for professional web archiving
     
+    Results are cached per URL, so callers must treat the returned dict as read-only.
+    """
     parsed = urlparse(url)
     analysis = {
         "url": url,
@@ -847,7 +1307,7 @@ async def create_archive(request: ArchiveRequest, background_tasks: BackgroundTa
     url = str(request.url)
     analysis = analyze_url_for_crawler_type(url)
     
-    job_id = str(uuid.uuid4())
+    job_id = uuid.uuid4().hex
     job_data = {
         "job_id": job_id,
         "url": url,
@@ -879,8 +1339,16 @@ async def create_archive(request: ArchiveRequest, background_tasks: BackgroundTa
         "reason": analysis["reason"]
     }
 
+async def get_existing_job(job_id: str) -> dict:
+    """Path dependency: the job row for job_id, or a 404"""
+    job = await job_manager.get_job(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return job
+
 @app.post("/api/retry/{job_id}")
-async def retry_archive(job_id: str, background_tasks: BackgroundTasks):
+async def retry_archive(job_id: str, background_tasks: BackgroundTasks,
+                        existing_job: dict = Depends(get_existing_job)):
     
     # Check if Docker is available
     if not docker_client:
@@ -889,11 +1357,6 @@ async def retry_archive(job_id: str, background_tasks: BackgroundTasks):
             detail="Docker is not available. Please ensure Docker is running and accessible."
         )
     
-    # Get the existing job
-    existing_job = await job_manager.get_job(job_id)
-    if not existing_job:
-        raise HTTPException(status_code=404, detail="Job not found")
-    
     # Reset the job to restart state
     await job_manager.update_job(job_id, {
         "status": "started",
@@ -913,14 +1376,9 @@ async def retry_archive(job_id: str, background_tasks: BackgroundTasks):
 
 
 @app.post("/api/stop/{job_id}")
-async def stop_job(job_id: str):
+async def stop_job(job_id: str, existing_job: dict = Depends(get_existing_job)):
     """Stop an active job and its Docker container"""
     
-    # Get the job to check if it exists
-    existing_job = await job_manager.get_job(job_id)
-    if not existing_job:
-        raise HTTPException(status_code=404, detail="Job not found")
-    
     # Only allow stopping of active jobs
     if existing_job["status"] not in ["started", "crawling", "preparing", "uploading_gcs"]:
         raise HTTPException(status_code=400, detail="Only active jobs can be stopped")
@@ -929,12 +1387,12 @@ async def stop_job(job_id: str):
     container_stopped = False
     if existing_job.get("container_id") and docker_client:
         try:
-            container = docker_client.containers.get(existing_job["container_id"])
+            container = await asyncio.to_thread(docker_client.containers.get, existing_job["container_id"])
             if container.status == "running":
-                container.stop(timeout=10)
+                await asyncio.to_thread(container.stop, timeout=10)
                 container_stopped = True
                 # Remove the stopped container
-                container.remove()
+                await asyncio.to_thread(container.remove)
         except Exception:
             # Container might not exist or already stopped
             pass
@@ -952,12 +1410,7 @@ async def stop_job(job_id: str):
     return {"message": message, "job_id": job_id}
 
 @app.delete("/api/delete/{job_id}")
-async def delete_job(job_id: str):
-    
-    # Get the job to check if it exists
-    existing_job = await job_manager.get_job(job_id)
-    if not existing_job:
-        raise HTTPException(status_code=404, detail="Job not found")
+async def delete_job(job_id: str, existing_job: dict = Depends(get_existing_job)):
     
     # Only allow deletion of failed jobs for safety
     if existing_job["status"] != "failed":
@@ -968,15 +1421,60 @@ async def delete_job(job_id: str):
     
     return {"message": "Job deleted successfully", "job_id": job_id}
 
+def delete_local_archive(local_path: str):
+    """Remove the job directory that holds a local archive file"""
+    # Build full path to the file
+    full_file_path = os.path.join(ARCHIVE_DIR, local_path)
+    
+    # Get the job directory (parent directory of the file)
+    job_directory = os.path.dirname(full_file_path)
+    
+    # A missing directory is treated as already deleted
+    if os.path.exists(job_directory):
+        # Remove the entire job directory and all its contents
+        shutil.rmtree(job_directory)
+    storage_manager.forget_dir(job_directory)
+
+@lru_cache(maxsize=None)
+def get_gcs_client():
+    """Process-wide storage client, so credential discovery and its HTTP connection
+    pool are set up once rather than per upload or delete"""
+    if storage is None:
+        raise RuntimeError("Google Cloud Storage library not installed")
+    return storage.Client()
+
+@lru_cache(maxsize=None)
+def get_gcs_bucket(bucket_name: str):
+    return get_gcs_client().bucket(bucket_name)
+
+# Buckets whose uniform bucket-level access rejected an object ACL; public reads
+# there come from the bucket's IAM policy, so later uploads skip make_public
+gcs_uniform_buckets = set()
+
+def delete_gcs_archive(job: dict):
+    """Delete a job's uploaded archive object from Google Cloud Storage"""
+    bucket_name = job.get("gcs_bucket")
+    object_name = job.get("gcs_object")
+    if not (bucket_name and object_name):
+        # Jobs uploaded before the object location was stored only have the URL
+        # Format: https://storage.googleapis.com/bucket/path/to/file
+        path_parts = urlparse(job["gcs_url"]).path.strip('/').split('/')
+        bucket_name = path_parts[0]
+        object_name = '/'.join(path_parts[1:])
+    
+    blob = get_gcs_bucket(bucket_name).blob(object_name)
+    
+    # A missing object is treated as already deleted; deleting straight away saves
+    # the metadata GET that an exists() check would cost
+    try:
+        blob.delete()
+    except GCSNotFound:
+        pass
+
 @app.delete("/api/delete-archive/{job_id}")
-async def delete_archive(job_id: str):
+async def delete_archive(job_id: str, existing_job: dict = Depends(get_existing_job)):
     """Delete archive from database, local storage, and cloud storage"""
     
-    # Get the job to check if it exists
-    existing_job = await job_manager.get_job(job_id)
-    if not existing_job:
-        raise HTTPException(status_code=404, detail="Job not found")
-    
     # Only allow deletion of completed, failed, or stopped jobs for safety
     if existing_job["status"] not in ["completed", "failed", "gcs_upload_failed", "stopped"]:
         raise HTTPException(status_code=400, detail="Only completed, failed, or stopped jobs can be deleted")
@@ -988,57 +1486,34 @@ async def delete_archive(job_id: str):
         "errors": []
     }
     
-    # 1. Delete from local file system
-    if existing_job.get("local_path"):
+    async def run_deletion(result_key: str, delete_func, target, error_prefix: str):
         try:
-            import os
-            import shutil
-            
-            # Build full path to the file
-            full_file_path = os.path.join("archives", existing_job["local_path"])
-            
-            # Get the job directory (parent directory of the file)
-            job_directory = os.path.dirname(full_file_path)
-            
-            if os.path.exists(job_directory):
-                # Remove the entire job directory and all its contents
-                shutil.rmtree(job_directory)
-                results["local_file"] = True
-                pass
-            else:
-                results["local_file"] = True  # Directory doesn't exist, consider it deleted
+            await asyncio.to_thread(delete_func, target)
+            results[result_key] = True
         except Exception as e:
-            results["errors"].append(f"Failed to delete local directory: {str(e)}")
+            results["errors"].append(f"{error_prefix}: {str(e)}")
+    
+    deletions = []
+    
+    # 1. Delete from local file system
+    if existing_job.get("local_path"):
+        deletions.append(run_deletion(
+            "local_file", delete_local_archive, existing_job["local_path"],
+            "Failed to delete local directory"
+        ))
     
     # 2. Delete from Google Cloud Storage
     if existing_job.get("gcs_url"):
-        try:
-            import google.cloud.storage
-            import os
-            from urllib.parse import urlparse
-            
-            # Parse GCS URL to get bucket and object name
-            # Format: https://storage.googleapis.com/bucket/path/to/file
-            parsed_url = urlparse(existing_job["gcs_url"])
-            path_parts = parsed_url.path.strip('/').split('/')
-            bucket_name = path_parts[0]
-            object_name = '/'.join(path_parts[1:])
-            
-            client = google.cloud.storage.Client()
-            bucket = client.bucket(bucket_name)
-            blob = bucket.blob(object_name)
-            
-            if blob.exists():
-                blob.delete()
-                results["gcs_file"] = True
-            else:
-                results["gcs_file"] = True  # File doesn't exist, consider it deleted
-                
-        except Exception as e:
-            results["errors"].append(f"Failed to delete GCS file: {str(e)}")
+        deletions.append(run_deletion(
+            "gcs_file", delete_gcs_archive, existing_job,
+            "Failed to delete GCS file"
+        ))
     else:
         results["gcs_file"] = True  # No GCS file to delete
     
+    # Local and cloud copies are independent, so remove them concurrently
+    await asyncio.gather(*deletions)
+    
     # 3. Delete from database (do this last in case of errors above)
     try:
         await job_manager.delete_job(job_id)
@@ -1063,14 +1538,11 @@ async def delete_archive(job_id: str):
     return response
 
 @app.post("/api/upload-gcs/{job_id}")
-async def upload_to_gcs(job_id: str, background_tasks: BackgroundTasks):
+async def upload_to_gcs(job_id: str, background_tasks: BackgroundTasks,
+                        existing_job: dict = Depends(get_existing_job)):
     """Upload WACZ archive to Google Cloud Storage for replayweb.page access"""
     
-    # Get the job to check if it exists and is completed
-    existing_job = await job_manager.get_job(job_id)
-    if not existing_job:
-        raise HTTPException(status_code=404, detail="Job not found")
-    
+    # Only completed jobs have an archive to upload
     if existing_job["status"] not in ["completed", "gcs_upload_failed"]:
         raise HTTPException(status_code=400, detail="Only completed jobs can be uploaded to GCS")
     
@@ -1081,34 +1553,78 @@ async def upload_to_gcs(job_id: str, background_tasks: BackgroundTasks):
         raise HTTPException(status_code=400, detail="No local archive file found")
     
     # Check if GCS is configured before starting
-    try:
-        import google.cloud.storage
-        import os
-        if not os.getenv("GOOGLE_APPLICATION_CREDENTIALS") and not os.getenv("GCS_BUCKET"):
-            raise HTTPException(
-                status_code=503, 
-                detail="Google Cloud Storage is not configured. Please set GOOGLE_APPLICATION_CREDENTIALS and GCS_BUCKET environment variables."
-            )
-    except ImportError:
+    if storage is None:
         raise HTTPException(
             status_code=503, 
             detail="Google Cloud Storage library not installed. Run: pip install google-cloud-storage"
         )
+    if not os.getenv("GOOGLE_APPLICATION_CREDENTIALS") and not os.getenv("GCS_BUCKET"):
+        raise HTTPException(
+            status_code=503, 
+            detail="Google Cloud Storage is not configured. Please set GOOGLE_APPLICATION_CREDENTIALS and GCS_BUCKET environment variables."
+        )
     
     # Start GCS upload in background
     background_tasks.add_task(upload_archive_to_gcs, job_id, existing_job["local_path"])
     
     return {"message": "GCS upload started", "job_id": job_id}
 
+class ProgressSnapshot:
+    """Encoded job list shared by every /api/progress stream"""
+    
+    def __init__(self, manager: SQLiteJobManager):
+        self.manager = manager
+        self.version = None
+        self.payload = b""
+        self._lock = asyncio.Lock()
+    
+    async def get(self) -> tuple:
+        """Return (version, payload), rebuilding only when a job changed since the last build"""
+        async with self._lock:
+            version = self.manager.version
+            if version != self.version:
+                jobs = await self.manager.get_job_summaries()
+                # Filter out invalid jobs once per change instead of once per connected client
+                valid_jobs = [job for job in jobs if job and job.get('job_id') and job.get('url') and job.get('status')]
+                self.payload = orjson.dumps({'jobs': valid_jobs})
+                self.version = version
+            return self.version, self.payload
+
+progress_snapshot = ProgressSnapshot(job_manager)
+
 @app.get("/api/progress")
 async def get_progress():
     async def event_stream():
-        while True:
-            jobs = await job_manager.get_all_jobs()
-            # Filter out invalid jobs and send the complete job list
-            valid_jobs = [job for job in jobs if job and job.get('job_id') and job.get('url') and job.get('status')]
-            yield f"data: {json.dumps({'jobs': valid_jobs})}\n\n"
-            await asyncio.sleep(1)
+        # Subscribe before taking the snapshot so no change can fall between the two
+        subscriber = job_manager.subscribe()
+        try:
+            # The full job list goes out once; after that only the changed fields are sent
+            _, payload = await progress_snapshot.get()
+            yield b"event: snapshot\ndata: " + payload + b"\n\n"
+            while True:
+                try:
+                    event = await asyncio.wait_for(subscriber.get(), SSE_HEARTBEAT_INTERVAL)
+                except asyncio.TimeoutError:
+                    # An SSE comment line keeps idle connections open through proxies
+                    yield b": keep-alive\n\n"
+                    continue
+                
+                # Send everything that is already queued in a single write
+                events = [event]
+                while not subscriber.empty():
+                    events.append(subscriber.get_nowait())
+                
+                if None in events:
+                    # Fell behind and lost deltas; the snapshot already reflects all of them
+                    _, payload = await progress_snapshot.get()
+                    yield b"event: snapshot\ndata: " + payload + b"\n\n"
+                else:
+                    yield b"".join(
+                        b"event: " + name.encode() + b"\ndata: " + orjson.dumps(data) + b"\n\n"
+                        for name, data in events
+                    )
+        finally:
+            job_manager.unsubscribe(subscriber)
     
     return StreamingResponse(event_stream(), media_type="text/event-stream")
 
@@ -1135,6 +1651,26 @@ async def playback_archive(job_id: str):
     }
 
 
+def find_wacz_file(directory: str) -> Optional[str]:
+    """Return the path of the WACZ file in a crawl output directory, if there is one"""
+    crawl_dir = Path(directory)
+    # browsertrix writes collections/<name>/<name>.wacz, so look there before falling
+    # back to a recursive search; either way stop at the first match rather than walking
+    # every WARC, page and screenshot file the crawl left behind
+    wacz_file = next(crawl_dir.glob("collections/*/*.wacz"), None) or next(crawl_dir.rglob("*.wacz"), None)
+    return str(wacz_file) if wacz_file else None
+
+def remove_crawl_dir(directory: str):
+    """Delete a crawl output directory, which can hold tens of thousands of small files"""
+    try:
+        # find unlinks entries in a single native process, faster than rmtree's
+        # per-entry Python calls on large trees
+        subprocess.run(["find", directory, "-delete"], check=True,
+                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    except (OSError, subprocess.CalledProcessError):
+        # No find binary, or it could not remove everything
+        shutil.rmtree(directory, ignore_errors=True)
+
 async def run_browsertrix_crawler(job_id: str, url: str):
     """Background task to run browsertrix-crawler in Docker"""
     try:
@@ -1152,55 +1688,19 @@ async def run_browsertrix_crawler(job_id: str, url: str):
         try:
             await job_manager.update_job(job_id, {"progress": 20})
             
-            # Configure browsertrix-crawler parameters for comprehensive crawling
-            crawler_config = {
-                "url": url,
-                "collection": f"archive-{job_id}",
-                "depth": 6,  # Increased depth for deeper crawling
-                "limit": 200,  # Increased page limit
-                "timeout": 1800,  # Increased timeout to 30 minutes
-                "workers": 3,  # More workers for faster crawling
-                "screenshot": "view",
-                "screencastTimeout": 15,
-                "behaviors": "autoscroll,autoplay,autofetch,siteSpecific",
-                "userAgent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-                "scopeType": "host",  # Changed from "prefix" to "host" for broader crawling
-                "include": "same-domain",
-                "extraHops": 1,  # Allow one extra hop to find more content
-                "delay": 0,  # No delay for faster crawling
-                "maxLoadWaitTime": 10000  # Wait up to 10 seconds for page loads
-            }
-            
             # Build crawler command
-            crawler_cmd = [
-                "crawl",
-                "--url", url,
-                "--collection", crawler_config["collection"],
-                "--depth", str(crawler_config["depth"]),
-                "--limit", str(crawler_config["limit"]),
-                "--timeout", str(crawler_config["timeout"]),
-                "--workers", str(crawler_config["workers"]),
-                "--screenshot", crawler_config["screenshot"],
-                "--screencastTimeout", str(crawler_config["screencastTimeout"]),
-                "--behaviors", crawler_config["behaviors"],
-                "--userAgent", crawler_config["userAgent"],
-                "--scopeType", crawler_config["scopeType"],
-                "--include", crawler_config["include"],
-                "--extraHops", str(crawler_config["extraHops"]),
-                "--delay", str(crawler_config["delay"]),
-                "--maxLoadWaitTime", str(crawler_config["maxLoadWaitTime"]),
-                "--generateWACZ",
-                "--text",
-                "--logging", "info"
-            ]
+            crawler_cmd = ["crawl", "--url", url, "--collection", f"archive-{job_id}", *BROWSERTRIX_CRAWL_ARGS]
             
             pass
             
             await job_manager.update_job(job_id, {"status": "preparing", "progress": 30})
             
-            # Run browsertrix-crawler in Docker with error handling
+            # Run browsertrix-crawler in Docker with error handling. The docker SDK keeps
+            # a pooled connection to the daemon socket but every call blocks, so each one
+            # runs in a worker thread
             try:
-                container = docker_client.containers.run(
+                container = await asyncio.to_thread(
+                    docker_client.containers.run,
                     "webrecorder/browsertrix-crawler:latest",
                     command=crawler_cmd,
                     volumes={
@@ -1226,7 +1726,7 @@ async def run_browsertrix_crawler(job_id: str, url: str):
             await job_manager.update_job(job_id, {"status": "crawling", "progress": 10})
             
             # Don't block the main thread - let the container run and monitor progress separately
-            # The container will run independently and we'll check its status periodically
+            # The container will run independently and we'll follow its logs for progress
             
             # Start a background task to monitor progress without blocking
             async def monitor_container_progress():
@@ -1244,139 +1744,140 @@ async def run_browsertrix_crawler(job_id: str, url: str):
                     
                     # Check if container was created and is running using fresh reference
                     try:
-                        current_container = docker_client.containers.get(container_id)
-                        print(f"DEBUG: Container {container_id} status: {current_container.status}")
+                        current_container = await asyncio.to_thread(docker_client.containers.get, container_id)
+                        logger.debug("Container %s status: %s", container_id, current_container.status)
                         if current_container.status == 'exited':
                             # Container completed successfully, handle completion
-                            print(f"DEBUG: Container completed successfully")
+                            logger.debug("Container %s completed", container_id)
                             await handle_container_completion(pages_archived, current_depth, container_id)
                             return
                         elif current_container.status not in ['running', 'created']:
-                            print(f"DEBUG: Container failed, status: {current_container.status}")
+                            logger.debug("Container %s failed, status: %s", container_id, current_container.status)
                             await job_manager.update_job(job_id, {"status": "failed", "progress": 0})
                             return
                     except Exception as e:
                         # Container creation failed or not found
-                        print(f"DEBUG: Failed to get container {container_id}: {e}")
+                        logger.debug("Failed to get container %s: %s", container_id, e)
                         await job_manager.update_job(job_id, {"status": "failed", "progress": 0})
                         return
                     
-                    # Monitor container progress
-                    while True:
+                    # The SDK's follow-mode log stream is a blocking generator, so a thread
+                    # drains it and hands complete lines to the event loop; None marks the end
+                    # of the stream, which happens when the container stops. The thread lives
+                    # as long as the crawl, so it is a dedicated one rather than a slot in the
+                    # default executor that every asyncio.to_thread call shares
+                    loop = asyncio.get_running_loop()
+                    log_lines = asyncio.Queue()
+                    pump_errors = []
+                    
+                    def pump_logs():
                         try:
-                            # Check if container is still running using fresh reference
-                            current_container = docker_client.containers.get(container_id)
-                            if current_container.status == 'exited':
-                                # Container finished - handle completion
-                                await handle_container_completion(pages_archived, current_depth, container_id)
-                                break
-                            elif current_container.status not in ['running', 'created']:
-                                # Container failed with unexpected status
-                                await job_manager.update_job(job_id, {"status": "failed", "progress": 0})
-                                break
-                                
-                            # Get recent logs (last 50 lines) to check progress
-                            logs = current_container.logs(tail=50).decode('utf-8')
-                            
-                            # Count page activity in recent logs
-                            import json
-                            log_lines = logs.strip().split('\n')
-                            recent_pages = 0
-                            
-                            for line in log_lines:
-                                try:
-                                    log_data = json.loads(line)
-                                    # Look for various page completion indicators
-                                    if (log_data.get("context") == "pageStatus" and log_data.get("message") == "Page Finished") or \
-                                       (log_data.get("context") == "general" and "moving on to next page" in log_data.get("message", "")) or \
-                                       (log_data.get("context") == "worker" and log_data.get("message") == "Starting page"):
-                                        recent_pages += 1
-                                except json.JSONDecodeError:
-                                    continue
-                            
-                            # Debug: show what we found
-                            if recent_pages > 0:
-                                print(f"DEBUG: Found {recent_pages} page events in recent logs")
-                            
-                            # Update progress if we found new pages
-                            if recent_pages > 0:
-                                # This is a rough estimate - we're counting recent pages
-                                pages_archived = max(pages_archived, recent_pages)
-                                progress = min(10 + int(pages_archived * 2), 80)
-                                
-                                await job_manager.update_job(job_id, {
-                                    "progress": progress, 
-                                    "pages_archived": pages_archived, 
-                                    "current_depth": current_depth
-                                })
-                                
+                            buffered = b""
+                            for chunk in current_container.logs(stream=True, follow=True):
+                                buffered += chunk
+                                *lines, buffered = buffered.split(b"\n")
+                                for line in lines:
+                                    loop.call_soon_threadsafe(log_lines.put_nowait, line)
                         except Exception as e:
-                            # Container might have stopped or failed
-                            try:
-                                current_container = docker_client.containers.get(container_id)
-                                if current_container.status == 'exited':
-                                    await handle_container_completion(pages_archived, current_depth, container_id)
-                                    break
-                                elif current_container.status not in ['running', 'created']:
-                                    await job_manager.update_job(job_id, {"status": "failed", "progress": 0})
-                                    break
-                            except:
-                                await job_manager.update_job(job_id, {"status": "failed", "progress": 0})
-                                break
-                                
-                        # Wait before checking again
-                        await asyncio.sleep(5)
+                            pump_errors.append(e)
+                        finally:
+                            loop.call_soon_threadsafe(log_lines.put_nowait, None)
+                    
+                    threading.Thread(target=pump_logs, name=f"crawl-logs-{job_id[:8]}", daemon=True).start()
+                    
+                    # Each page logs each of these messages at most once, so the most frequent
+                    # one is the number of pages seen so far
+                    page_events = {"pageStatus": 0, "general": 0, "worker": 0}
+                    last_update = 0.0
+                    
+                    while True:
+                        line = await log_lines.get()
+                        if line is None:
+                            break
+                        if not PAGE_EVENT_RE.search(line):
+                            continue
+                        try:
+                            log_data = orjson.loads(line)
+                        except orjson.JSONDecodeError:
+                            continue
+                        if not isinstance(log_data, dict):
+                            continue
+                        
+                        # Look for various page completion indicators
+                        context = log_data.get("context")
+                        message = log_data.get("message", "")
+                        if (context == "pageStatus" and message == "Page Finished") or \
+                           (context == "general" and "moving on to next page" in message) or \
+                           (context == "worker" and message == "Starting page"):
+                            page_events[context] += 1
+                        else:
+                            continue
+                        
+                        pages_archived = max(page_events.values())
+                        progress = min(10 + int(pages_archived * 2), 80)
+                        
+                        # Report at most once per flush interval however fast pages are logged
+                        now = time.monotonic()
+                        if now - last_update >= PROGRESS_FLUSH_INTERVAL:
+                            last_update = now
+                            logger.debug("Job %s has archived %d pages", job_id, pages_archived)
+                            await job_manager.update_job(job_id, {
+                                "progress": progress, 
+                                "pages_archived": pages_archived, 
+                                "current_depth": current_depth
+                            })
+                    
+                    if pump_errors:
+                        raise pump_errors[0]
+                    
+                    # The log stream ends when the container stops; the completion handler
+                    # waits for the exit code in case the status has not caught up yet
+                    current_container = await asyncio.to_thread(docker_client.containers.get, container_id)
+                    if current_container.status in ['exited', 'running']:
+                        await handle_container_completion(pages_archived, current_depth, container_id)
+                    else:
+                        await job_manager.update_job(job_id, {"status": "failed", "progress": 0})
                         
                 except Exception as e:
                     # Any unhandled exception should mark job as failed
-                    print(f"DEBUG: Monitoring task failed with exception: {e}")
-                    import traceback
-                    traceback.print_exc()
+                    logger.exception("Monitoring task failed for job %s", job_id)
                     await job_manager.update_job(job_id, {"status": "failed", "progress": 0})
                     
             async def handle_container_completion(pages_archived, current_depth, container_id):
                 """Handle container completion and file processing"""
                 try:
                     # Get container and check exit code
-                    container_obj = docker_client.containers.get(container_id)
-                    result = container_obj.wait()
+                    container_obj = await asyncio.to_thread(docker_client.containers.get, container_id)
+                    result = await asyncio.to_thread(container_obj.wait)
                     exit_code = result['StatusCode']
-                    print(f"DEBUG: Container exit code: {exit_code}")
+                    logger.debug("Container %s exit code: %s", container_id, exit_code)
                     
                     if exit_code != 0:
-                        print(f"DEBUG: Container failed with exit code: {exit_code}")
+                        logger.warning("Crawl for job %s failed with exit code %s", job_id, exit_code)
                         await job_manager.update_job(job_id, {"status": "failed", "progress": 0})
                         return
                     
                     await job_manager.update_job(job_id, {"progress": 95})
                     
                     # Find the generated WACZ file
-                    wacz_files = []
-                    for root, _, files in os.walk(temp_dir):
-                        for file in files:
-                            if file.endswith('.wacz'):
-                                wacz_files.append(os.path.join(root, file))
+                    wacz_file = await asyncio.to_thread(find_wacz_file, temp_dir)
                     
-                    print(f"DEBUG: Found {len(wacz_files)} WACZ files in {temp_dir}")
-                    if not wacz_files:
-                        print(f"DEBUG: No WACZ files found, marking as failed")
+                    if not wacz_file:
+                        logger.warning("No WACZ file produced for job %s, marking as failed", job_id)
                         await job_manager.update_job(job_id, {"status": "failed", "progress": 0})
                         return
                     
-                    # Use the first WACZ file found
-                    wacz_file = wacz_files[0]
-                    print(f"DEBUG: Using WACZ file: {wacz_file}")
+                    logger.debug("Using WACZ file: %s", wacz_file)
                     
                     # Save to local storage with simple filename for replayweb.page compatibility
                     filename = f"{job_id[:8]}.wacz"
-                    print(f"DEBUG: Saving to storage as: {filename}")
+                    logger.debug("Saving to storage as: %s", filename)
                     await storage_manager.save_binary_archive(wacz_file, job_id, filename)
                     
                     # Get file size
-                    file_size = os.path.getsize(wacz_file)
-                    print(f"DEBUG: Archive file size: {file_size} bytes")
+                    file_size = await asyncio.to_thread(os.path.getsize, wacz_file)
+                    logger.debug("Archive file size: %d bytes", file_size)
                     
-                    print(f"DEBUG: Marking job as completed")
                     await job_manager.update_job(job_id, {
                         "status": "completed",
                         "progress": 100,
@@ -1387,25 +1888,23 @@ async def run_browsertrix_crawler(job_id: str, url: str):
                         "current_depth": current_depth,
                         "file_size": file_size
                     })
-                    print(f"DEBUG: Job marked as completed successfully")
+                    logger.info("Job %s completed with %d pages archived", job_id, pages_archived)
                     
                     # Clean up container after successful completion
                     try:
                         if docker_client and container_id:
                             if container_obj.status in ['exited', 'stopped']:
-                                container_obj.remove()
+                                await asyncio.to_thread(container_obj.remove)
                     except Exception:
                         pass
                     
                 except Exception as e:
-                    print(f"DEBUG: Exception in completion handler: {e}")
-                    import traceback
-                    traceback.print_exc()
+                    logger.exception("Completion handler failed for job %s", job_id)
                     await job_manager.update_job(job_id, {"status": "failed", "progress": 0})
                 finally:
                     # Clean up temp directory after container completes
                     try:
-                        shutil.rmtree(temp_dir)
+                        await asyncio.to_thread(remove_crawl_dir, temp_dir)
                     except Exception:
                         pass
             
@@ -1423,14 +1922,12 @@ async def run_browsertrix_crawler(job_id: str, url: str):
                 
     except Exception as e:
         await job_manager.update_job(job_id, {"status": "failed", "progress": 0})
-        pass
-        import traceback
-        traceback.print_exc()
+        logger.exception("Failed to start crawl for job %s", job_id)
 
 
 def parse_crawler_progress(output: str) -> Optional[int]:
     """Parse progress from crawler output"""
-    page_match = re.search(r'(\d+)/(\d+) pages', output)
+    page_match = PAGE_COUNT_RE.search(output)
     if page_match:
         current = int(page_match.group(1))
         total = int(page_match.group(2))
@@ -1450,41 +1947,65 @@ async def upload_archive_to_gcs(job_id: str, local_path: str):
         await job_manager.update_job(job_id, {"status": "uploading_gcs"})
         
         # Check if GCS credentials are available
+        if storage is None:
+            raise Exception("Google Cloud Storage library not installed. Run: pip install google-cloud-storage")
         try:
-            from google.cloud import storage
-            import os
-            
             # Check for GCS credentials
             if not os.getenv("GOOGLE_APPLICATION_CREDENTIALS") and not os.getenv("GCS_BUCKET"):
                 raise Exception("GCS credentials or bucket not configured")
             
             bucket_name = os.getenv("GCS_BUCKET", "web-archives-bucket")
             
-            # Initialize GCS client
-            client = storage.Client()
-            bucket = client.bucket(bucket_name)
+            # First use creates the shared client, which can block on credential discovery
+            bucket = await asyncio.to_thread(get_gcs_bucket, bucket_name)
             
             # Create simple blob name for replayweb.page compatibility
             file_path = os.path.join(ARCHIVE_DIR, local_path)
             simple_filename = f"{job_id[:8]}.wacz"
             blob_name = f"archives/{simple_filename}"
             blob = bucket.blob(blob_name)
+            blob.cache_control = GCS_CACHE_CONTROL
             
             pass
             
             # Update progress
             await job_manager.update_job(job_id, {"progress": 50})
             
-            # Upload file
-            blob.upload_from_filename(file_path)
+            # Upload file off the event loop; large archives go up as concurrent chunks
+            # that GCS reassembles, small ones in a single request
+            if await asyncio.to_thread(os.path.getsize, file_path) > GCS_UPLOAD_CHUNK_SIZE:
+                await asyncio.to_thread(
+                    transfer_manager.upload_chunks_concurrently,
+                    file_path,
+                    blob,
+                    chunk_size=GCS_UPLOAD_CHUNK_SIZE,
+                    worker_type=transfer_manager.THREAD,
+                    max_workers=GCS_UPLOAD_WORKERS
+                )
+            else:
+                await asyncio.to_thread(blob.upload_from_filename, file_path)
             
             # Update progress after upload
             await job_manager.update_job(job_id, {"progress": 90})
             
-            # Make blob publicly readable
-            blob.make_public()
+            # Make blob publicly readable. Uniform-access buckets reject object ACLs with
+            # a 400 and grant public reads bucket-wide instead, so the ACL is skipped
+            # there; that is learned from the first rejection rather than by reading the
+            # bucket's metadata, which would need bucket-level permissions
+            if bucket_name not in gcs_uniform_buckets:
+                try:
+                    await asyncio.to_thread(blob.make_public)
+                except GCSBadRequest as e:
+                    if "uniform bucket-level access" not in str(e).lower():
+                        raise
+                    gcs_uniform_buckets.add(bucket_name)
+                    logger.warning(
+                        "Bucket %s uses uniform bucket-level access; archives are only "
+                        "publicly readable if its IAM policy grants allUsers read access",
+                        bucket_name
+                    )
             
-            # Get public URL
+            # Public URL is built locally from the bucket and object name
             gcs_url = blob.public_url
             
             pass
@@ -1492,11 +2013,11 @@ async def upload_archive_to_gcs(job_id: str, local_path: str):
             # Update job with GCS URL and restore completed status
             await job_manager.update_job(job_id, {
                 "status": "completed",
-                "gcs_url": gcs_url
+                "gcs_url": gcs_url,
+                "gcs_bucket": bucket_name,
+                "gcs_object": blob_name
             })
             
-        except ImportError:
-            raise Exception("Google Cloud Storage library not installed. Run: pip install google-cloud-storage")
         except Exception as gcs_error:
             raise Exception(f"GCS upload failed: {gcs_error}")
             
@@ -1509,71 +2030,53 @@ async def upload_archive_to_gcs(job_id: str, local_path: str):
             "status": "gcs_upload_failed",
             "gcs_error": error_msg
         })
-        import traceback
-        traceback.print_exc()
+        logger.exception("GCS upload failed for job %s", job_id)
 
 @app.get("/api/download/{job_id}/{filename}")
 async def download_archive(job_id: str, filename: str):
     file_path = os.path.join(ARCHIVE_DIR, job_id, filename)
-    if not os.path.exists(file_path):
+    if not await asyncio.to_thread(os.path.exists, file_path):
         raise HTTPException(status_code=404, detail="Archive file not found")
     
-    from fastapi.responses import FileResponse
     return FileResponse(file_path, filename=filename)
 
 @app.get("/api/download/{local_path:path}")
 async def download_archive_by_path(local_path: str):
     """Download archive using the full local path (job_id/filename format)"""
     file_path = os.path.join(ARCHIVE_DIR, local_path)
-    if not os.path.exists(file_path):
+    if not await asyncio.to_thread(os.path.exists, file_path):
         raise HTTPException(status_code=404, detail="Archive file not found")
     
-    from fastapi.responses import FileResponse
     filename = os.path.basename(file_path)
     return FileResponse(file_path, filename=filename)
 
 @app.options("/api/serve/{job_id}/{filename}")
 async def serve_archive_options(job_id: str, filename: str):
     """Handle CORS preflight requests for archive serving"""
-    from fastapi.responses import Response
-    headers = {
-        "Access-Control-Allow-Origin": "*",
-        "Access-Control-Allow-Methods": "GET, HEAD, OPTIONS",
-        "Access-Control-Allow-Headers": "*",
-        "Access-Control-Max-Age": "86400"
-    }
-    return Response(headers=headers)
+    return Response(headers=ARCHIVE_PREFLIGHT_HEADERS)
 
 @app.get("/api/serve/{job_id}/{filename}")
 @app.head("/api/serve/{job_id}/{filename}")
 async def serve_archive(job_id: str, filename: str, request: Request):
     """Serve archive files with range request support for replayweb.page"""
-    from fastapi.responses import Response, StreamingResponse
-    import mimetypes
     
     file_path = os.path.join(ARCHIVE_DIR, job_id, filename)
-    if not os.path.exists(file_path):
+    try:
+        # One stat per request, so a replaced or removed archive is never served with
+        # a stale size; it runs in a thread since network-mounted storage can be slow
+        stat_result = await asyncio.to_thread(os.stat, file_path)
+    except FileNotFoundError:
         raise HTTPException(status_code=404, detail="Archive file not found")
-    
-    file_size = os.path.getsize(file_path)
+    file_size = stat_result.st_size
     
     # Set content type - WACZ files should be served as application/wacz
-    if filename.endswith('.wacz'):
+    if file_path.endswith('.wacz'):
         content_type = "application/wacz"
     else:
-        content_type = mimetypes.guess_type(filename)[0] or "application/octet-stream"
+        content_type = mimetypes.guess_type(file_path)[0] or "application/octet-stream"
     
     # Common headers
-    headers = {
-        "Accept-Ranges": "bytes",
-        "Content-Type": content_type,
-        "Access-Control-Allow-Origin": "*",
-        "Access-Control-Allow-Methods": "GET, HEAD, OPTIONS",
-        "Access-Control-Allow-Headers": "*",
-        "Access-Control-Expose-Headers": "Accept-Ranges, Content-Length, Content-Range",
-        "Cross-Origin-Embedder-Policy": "require-corp",
-        "Cross-Origin-Opener-Policy": "same-origin"
-    }
+    headers = {**ARCHIVE_RESPONSE_HEADERS, "Content-Type": content_type}
     
     # Handle HEAD requests
     if request.method == "HEAD":
@@ -1582,63 +2085,60 @@ async def serve_archive(job_id: str, filename: str, request: Request):
     
     # Handle range requests
     range_header = request.headers.get("range")
-    if range_header:
-        try:
-            # Parse range header (e.g., "bytes=0-1023")
-            range_match = range_header.replace("bytes=", "").split("-")
-            start = int(range_match[0]) if range_match[0] else 0
-            end = int(range_match[1]) if range_match[1] else file_size - 1
-            
-            # Validate range
-            if start >= file_size or end >= file_size or start > end:
-                headers["Content-Range"] = f"bytes */{file_size}"
-                return Response(status_code=416, headers=headers)
-            
-            # Set range response headers
-            content_length = end - start + 1
-            headers.update({
-                "Content-Length": str(content_length),
-                "Content-Range": f"bytes {start}-{end}/{file_size}"
-            })
-            
-            # Stream the requested range
-            async def stream_range():
-                with open(file_path, "rb") as f:
-                    f.seek(start)
-                    remaining = content_length
-                    while remaining > 0:
-                        chunk_size = min(8192, remaining)
-                        chunk = f.read(chunk_size)
-                        if not chunk:
-                            break
-                        remaining -= len(chunk)
-                        yield chunk
-            
-            return StreamingResponse(stream_range(), status_code=206, headers=headers)
+    range_match = RANGE_RE.fullmatch(range_header) if range_header else None
+    if range_match and (range_match.group(1) or range_match.group(2)):
+        first, last = range_match.groups()
+        if first and last:
+            start = int(first)
+            end = min(int(last), file_size - 1)
+        elif first:
+            start = int(first)
+            end = min(file_size, start + ARCHIVE_MAX_RANGE_SIZE) - 1
+        else:
+            # Suffix range: the last N bytes
+            start = max(file_size - int(last), 0)
+            end = file_size - 1
         
-        except (ValueError, IndexError):
-            # Invalid range header, fall back to full file
-            pass
-    
-    # Serve full file
-    headers["Content-Length"] = str(file_size)
-    
-    async def stream_file():
-        with open(file_path, "rb") as f:
-            while True:
-                chunk = f.read(8192)
-                if not chunk:
-                    break
-                yield chunk
+        # Validate range
+        if start >= file_size or start > end:
+            headers["Content-Range"] = f"bytes */{file_size}"
+            return Response(status_code=416, headers=headers)
+        
+        # Set range response headers
+        content_length = end - start + 1
+        headers.update({
+            "Content-Length": str(content_length),
+            "Content-Range": f"bytes {start}-{end}/{file_size}"
+        })
+        
+        # Stream the requested range; reads run in a worker thread
+        async def stream_range():
+            async with aiofiles.open(file_path, "rb") as f:
+                await f.seek(start)
+                remaining = content_length
+                while remaining > 0:
+                    chunk = await f.read(min(ARCHIVE_STREAM_CHUNK_SIZE, remaining))
+                    if not chunk:
+                        break
+                    remaining -= len(chunk)
+                    yield chunk
+        
+        return StreamingResponse(stream_range(), status_code=206, headers=headers)
     
-    return StreamingResponse(stream_file(), headers=headers)
+    # Invalid or multi-part range headers are ignored and the full file is served
+    # Serve full file; FileResponse reads it off the event loop and sets Content-Length.
+    # Passing the stat result saves it a second stat of the file
+    return FileResponse(file_path, headers=headers, media_type=content_type, stat_result=stat_result)
 
 @app.get("/api/gcs-proxy/{job_id}")
 @app.head("/api/gcs-proxy/{job_id}")
-async def gcs_proxy(job_id: str, request: Request):
-    """Proxy GCS WACZ files with proper headers for replayweb.page"""
-    from fastapi.responses import StreamingResponse, Response
-    import aiohttp
+async def gcs_proxy(job_id: str, request: Request, stream: bool = False):
+    """Proxy GCS WACZ files with proper headers for replayweb.page
+    
+    Uploaded archives are public and the bucket's CORS policy allows any origin, so by
+    default clients are redirected to GCS and fetch the bytes from it directly. Pass
+    stream=true to have the bytes relayed through this server instead.
+    """
     
     # Get job to find GCS URL
     job = await job_manager.get_job(job_id)
@@ -1647,24 +2147,19 @@ async def gcs_proxy(job_id: str, request: Request):
     
     gcs_url = job['gcs_url']
     
+    if not stream:
+        # 307 keeps the method and the client re-sends its Range header to GCS
+        return RedirectResponse(gcs_url, status_code=307)
+    
     # Forward the request to GCS with proper headers
-    headers = {
-        "Accept-Ranges": "bytes",
-        "Content-Type": "application/octet-stream",  # Use octet-stream like official examples
-        "Access-Control-Allow-Origin": "*",
-        "Access-Control-Allow-Methods": "GET, HEAD, OPTIONS",
-        "Access-Control-Allow-Headers": "*",
-        "Access-Control-Expose-Headers": "Accept-Ranges, Content-Length, Content-Range",
-        "Cross-Origin-Embedder-Policy": "require-corp",
-        "Cross-Origin-Opener-Policy": "same-origin"
-    }
+    # Use octet-stream like official examples
+    headers = {**ARCHIVE_RESPONSE_HEADERS, "Content-Type": "application/octet-stream"}
     
     # Handle HEAD requests
     if request.method == "HEAD":
-        async with aiohttp.ClientSession() as session:
-            async with session.head(gcs_url) as response:
-                headers["Content-Length"] = response.headers.get("Content-Length", "0")
-                return Response(headers=headers)
+        async with gcs_http.head(gcs_url) as response:
+            headers["Content-Length"] = response.headers.get("Content-Length", "0")
+            return Response(headers=headers)
     
     # Handle range requests
     range_header = request.headers.get("range")
@@ -1674,19 +2169,18 @@ async def gcs_proxy(job_id: str, request: Request):
     
     # Stream from GCS and let aiohttp handle the headers properly
     async def stream_gcs():
-        async with aiohttp.ClientSession() as session:
-            async with session.get(gcs_url, headers=request_headers) as response:
-                # Forward the exact response headers from GCS
-                for header_name, header_value in response.headers.items():
-                    if header_name.lower() in ['content-length', 'content-range', 'content-type']:
-                        headers[header_name] = header_value
-                
-                # Override content-type to match replayweb.page expectations
-                headers["Content-Type"] = "application/octet-stream"
-                
-                # Stream the content
-                async for chunk in response.content.iter_chunked(8192):
-                    yield chunk
+        async with gcs_http.get(gcs_url, headers=request_headers) as response:
+            # Forward the exact response headers from GCS
+            for header_name, header_value in response.headers.items():
+                if header_name.lower() in ['content-length', 'content-range', 'content-type']:
+                    headers[header_name] = header_value
+            
+            # Override content-type to match replayweb.page expectations
+            headers["Content-Type"] = "application/octet-stream"
+            
+            # Stream the content
+            async for chunk in response.content.iter_chunked(ARCHIVE_STREAM_CHUNK_SIZE):
+                yield chunk
     
     status_code = 206 if range_header else 200
     return StreamingResponse(stream_gcs(), status_code=status_code, headers=headers)
@@ -1694,14 +2188,7 @@ async def gcs_proxy(job_id: str, request: Request):
 @app.options("/api/gcs-proxy/{job_id}")
 async def gcs_proxy_options(job_id: str):
     """Handle CORS preflight for GCS proxy"""
-    from fastapi.responses import Response
-    headers = {
-        "Access-Control-Allow-Origin": "*",
-        "Access-Control-Allow-Methods": "GET, HEAD, OPTIONS",
-        "Access-Control-Allow-Headers": "*",
-        "Access-Control-Max-Age": "86400"
-    }
-    return Response(headers=headers)
+    return Response(headers=ARCHIVE_PREFLIGHT_HEADERS)
 
 @app.get("/health")
 async def health_check():